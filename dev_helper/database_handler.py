@@ -1,12 +1,43 @@
 import os
+import pathlib as _pathlib
 import sqlalchemy as _sa
 import sqlalchemy.orm as _orm
 import contextlib as _ctx
 import threading as _threading
 import configparser
-from typing import Optional, Dict, List
+import functools as _functools
+from typing import Any, Optional, Dict, Iterator, List, Union
 import typing_extensions as _typing_extension
 
+_ENGINE_OPTIONS: Dict[str, Any] = {
+    "pool_size": 10,
+    "max_overflow": 5,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+_ENGINE_CACHE: Dict[str, _sa.engine.Engine] = {}
+_SESSION_FACTORY_CACHE: Dict[str, _orm.sessionmaker] = {}
+_ENGINE_CACHE_LOCK: _threading.Lock = _threading.Lock()
+
+
+@_functools.lru_cache(maxsize=32)
+def _load_config(path: str, mtime_ns: int) -> configparser.ConfigParser:
+    """
+    Parses the configuration file once per path and modification time.
+
+    Args:
+        path (str): The absolute path to the configuration file.
+        mtime_ns (int): The modification time of the file, used as cache key
+                        so that an edited file is parsed again.
+
+    Returns:
+        configparser.ConfigParser: The parsed configuration, shared between
+                                   handlers and therefore not to be modified.
+    """
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    return parser
+
 
 class DatabaseHandler:
     def __init__(
@@ -14,6 +45,8 @@ class DatabaseHandler:
         config_file: str = ".db.conf",
         section: str = "test_database",
         use_context_manager: bool = True,
+        deep_search: bool = False,
+        engine_options: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Initializes the DatabaseHandler.
@@ -23,13 +56,24 @@ class DatabaseHandler:
             section (str): The section name in the configuration file.
             use_context_manager (bool): If True, the handler will
                                         be used as a context manager.
+            deep_search (bool): If True, falls back to walking the whole
+                                filesystem when the configuration file is
+                                not found in the usual locations.
+            engine_options (dict): Optional keyword arguments for
+                                   `sqlalchemy.create_engine`. If given, the
+                                   handler creates its own engine instead of
+                                   sharing the pooled one, e.g.
+                                   `{"poolclass": sqlalchemy.pool.NullPool}`.
         """
-        self.config_file: str = self.find_config_file(config_file)
+        self.config_file: str = self.find_config_file(config_file, deep_search)
         self.config: Optional[configparser.ConfigParser] = None
+        self.section_config: Optional[Dict[str, str]] = None
         self.section: str = section
         self.use_context_manager: bool = use_context_manager
+        self.engine_options: Optional[Dict[str, Any]] = engine_options
         self.engine: Optional[_sa.engine.Engine] = None
-        self.lock: _threading.Lock = _threading.Lock()
+        self.session_factory: Optional[_orm.sessionmaker] = None
+        self._url: Optional[str] = None
 
     def __enter__(self) -> _typing_extension.Self:
         """
@@ -38,13 +82,12 @@ class DatabaseHandler:
         Returns:
             DatabaseHandler: The instance of the DatabaseHandler.
         """
+        self.connect()
+        self.session = self.create_session()
         if self.use_context_manager:
-            self.connect()
-            self.session = self.create_session()
             return self
         else:
-            self.connect()
-            return self.create_session()
+            return self.session
 
     def __exit__(
         self,
@@ -53,67 +96,133 @@ class DatabaseHandler:
         traceback: Optional[_sa.exc.DBAPIError],
     ) -> None:
         """
-        Exits a context managed block.
+        Exits a context managed block. The session is rolled back only if an
+        exception occurred and is always closed, which returns its connection
+        to the pool. Shared engines stay alive, see `shutdown`.
 
         Args:
             exc_type: The type of exception.
             exc_value: The exception instance.
             traceback: The traceback object.
         """
-        if not self.use_context_manager:
-            try:
+        try:
+            if exc_type is not None:
                 self.rollback_and_close()
-            finally:
-                if self.engine:
-                    try:
-                        self.engine.dispose()
-                    except Exception as dispose_error:
-                        print(f"Error during engine dispose: {dispose_error}")
+            elif hasattr(self, "session") and self.session:
+                try:
+                    self.session.close()
+                except Exception as close_error:
+                    print(f"Error during Session close: {close_error}")
+        finally:
+            self.session = None
+            if self.engine and self.engine_options is not None:
+                try:
+                    self.engine.dispose()
+                except Exception as dispose_error:
+                    print(f"Error during engine dispose: {dispose_error}")
+                self.engine = None
+                self.session_factory = None
 
-    def find_config_file(self, config_file: str) -> str:
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Disposes all shared engines and closes their pooled connections.
+        Handlers connecting afterwards create new engines.
         """
-        Finds the configuration file in the child directories starting from the root.
+        with _ENGINE_CACHE_LOCK:
+            engines: List[_sa.engine.Engine] = list(_ENGINE_CACHE.values())
+            _ENGINE_CACHE.clear()
+            _SESSION_FACTORY_CACHE.clear()
+        for engine in engines:
+            try:
+                engine.dispose()
+            except Exception as dispose_error:
+                print(f"Error during engine dispose: {dispose_error}")
+
+    def find_config_file(self, config_file: str, deep_search: bool = False) -> str:
+        """
+        Finds the configuration file, starting in the current working directory
+        and moving upwards to the root, then checking the home directory and
+        `/etc`.
 
         Args:
             config_file (str): The initial configuration file path.
+            deep_search (bool): If True, walks every child directory starting
+                                from the root as a last resort.
 
         Returns:
             str: The absolute path to the configuration file.
         """
-        root_dir: str = "/"  # Set the root directory to '/' for Unix-like systems
-        for dirpath, dirnames, filenames in os.walk(root_dir):
-            if config_file in filenames:
-                return os.path.join(dirpath, config_file)
+        cwd: _pathlib.Path = _pathlib.Path.cwd()
+        search_dirs: List[_pathlib.Path] = [
+            cwd,
+            *cwd.parents,
+            _pathlib.Path.home(),
+            _pathlib.Path("/etc"),
+        ]
+        for directory in search_dirs:
+            candidate: _pathlib.Path = directory / config_file
+            if candidate.is_file():
+                return str(candidate.resolve())
+
+        if deep_search:
+            root_dir: str = "/"  # Set the root directory to '/' for Unix-like systems
+            for dirpath, dirnames, filenames in os.walk(root_dir):
+                if config_file in filenames:
+                    return os.path.join(dirpath, config_file)
 
         raise FileNotFoundError(
-            f"{config_file} not found in any child directory starting from the root."
+            f"{config_file} not found in the working directory, its parents, "
+            "the home directory or /etc."
         )
 
     def connect(self) -> None:
         """
-        Connects to the database and creates an engine if
-        not already connected.
-        """
-        if not self.engine:
-            self.load_config()
-            host: str = self.config.get(self.section, "host")
-            port: str = self.config.get(self.section, "port")
-            user: str = self.config.get(self.section, "user")
-            password: str = self.config.get(
-                self.section,
-                "password",
-                fallback="postgres",
-            )
-            database: str = self.config.get(
-                self.section,
-                "database",
-                fallback="postgres",
-            )
+        Connects to the database if not already connected. Engines are
+        shared per connection string, so that their connection pool is
+        reused by every handler of the process. A shared engine that was
+        disposed by `shutdown` is replaced by the current cached one.
+        """
+        if self.engine is not None and (
+            self.engine_options is not None
+            or _ENGINE_CACHE.get(self._url) is self.engine
+        ):
+            return
 
-            connection_string: str = (
-                f"postgresql+psycopg2://{user}:{password}@" f"{host}:{port}/{database}"
+        self.load_config()
+        host: str = self._get_option("host")
+        port: str = self._get_option("port")
+        user: str = self._get_option("user")
+        password: str = self.section_config.get("password", "postgres")
+        database: str = self.section_config.get("database", "postgres")
+
+        connection_string: str = (
+            f"postgresql+psycopg://{user}:{password}@" f"{host}:{port}/{database}"
+        )
+        self._url = connection_string
+        if self.engine_options is not None:
+            self.engine = _sa.create_engine(connection_string, **self.engine_options)
+            self.session_factory = _orm.sessionmaker(
+                bind=self.engine, expire_on_commit=False
             )
-            self.engine = _sa.create_engine(connection_string)
+            return
+
+        session_factory: Optional[_orm.sessionmaker] = _SESSION_FACTORY_CACHE.get(
+            connection_string
+        )
+        engine: Optional[_sa.engine.Engine] = _ENGINE_CACHE.get(connection_string)
+        if engine is None or session_factory is None:
+            with _ENGINE_CACHE_LOCK:
+                engine = _ENGINE_CACHE.get(connection_string)
+                if engine is None:
+                    engine = _sa.create_engine(connection_string, **_ENGINE_OPTIONS)
+                    _ENGINE_CACHE[connection_string] = engine
+                    _SESSION_FACTORY_CACHE[connection_string] = _orm.sessionmaker(
+                        bind=engine, expire_on_commit=False
+                    )
+                session_factory = _SESSION_FACTORY_CACHE[connection_string]
+        self.engine = engine
+        self.session_factory = session_factory
 
     def rollback_and_close(self) -> None:
         """
@@ -134,6 +243,8 @@ class DatabaseHandler:
     def get_session(self) -> _ctx.AbstractContextManager[_orm.Session]:
         """
         Context manager for acquiring and managing a database session.
+        The session is committed on success, rolled back on error and
+        closed in both cases.
 
         Yields:
             sqlalchemy.orm.Session: The database session.
@@ -142,52 +253,111 @@ class DatabaseHandler:
         session: _orm.Session = self.create_session()
         try:
             yield session
-            self.rollback_and_close()
-        except Exception as e:
+            session.commit()
+        except Exception:
             session.rollback()
-            raise e
+            raise
+        finally:
+            session.close()
 
     def create_session(self) -> _orm.Session:
         """
-        Creates a new database session.
+        Creates a new database session from the session factory of the
+        engine, reconnecting first if the shared engine was disposed by
+        `shutdown`. Sessions do not expire their objects on commit.
 
         Returns:
             sqlalchemy.orm.Session: The created session.
         """
-        return _orm.Session(bind=self.engine)
+        self.connect()
+        return self.session_factory()
 
     def execute_query(
-        self, query: str, parameters: Optional[Dict[str, str]] = None
+        self,
+        query: Union[str, _sa.TextClause],
+        parameters: Optional[Dict[str, str]] = None,
     ) -> List:
         """
-        Executes a SQL query and returns the result.
+        Executes a SQL query on a pooled connection, commits it and returns
+        the result. Use `get_session` if an ORM session is needed.
 
         Args:
-            query (str): The SQL query to be executed.
+            query (str | sqlalchemy.TextClause): The SQL query to be executed,
+                                                 either as string or as an
+                                                 already built `text()` clause.
             parameters (dict): Optional parameters to be passed to the query.
 
         Returns:
             list: The result of the query.
         """
-        with self.get_session() as session:
-            result_proxy: _sa.engine.ResultProxy = session.execute(
-                _sa.text(query), parameters
+        if isinstance(query, str):
+            query = _sa.text(query)
+        self.connect()
+        with self.engine.begin() as connection:
+            result_proxy: _sa.engine.CursorResult = connection.execute(
+                query, parameters or {}
             )
             if result_proxy.returns_rows:
-                result: List = result_proxy.fetchall()
-                session.commit()
-                return result
+                return result_proxy.fetchall()
             else:
                 return []
 
+    def execute_query_iter(
+        self,
+        query: Union[str, _sa.TextClause],
+        parameters: Optional[Dict[str, str]] = None,
+    ) -> Iterator[_sa.Row]:
+        """
+        Executes a SQL query and yields the resulting rows one by one,
+        using a server side cursor instead of fetching all rows at once.
+        The connection is held until the iterator is exhausted or closed.
+
+        Args:
+            query (str | sqlalchemy.TextClause): The SQL query to be executed,
+                                                 either as string or as an
+                                                 already built `text()` clause.
+            parameters (dict): Optional parameters to be passed to the query.
+
+        Yields:
+            sqlalchemy.Row: The rows of the query result.
+        """
+        if isinstance(query, str):
+            query = _sa.text(query)
+        self.connect()
+        with self.engine.begin() as connection:
+            result_proxy: _sa.engine.CursorResult = connection.execution_options(
+                stream_results=True
+            ).execute(query, parameters or {})
+            if result_proxy.returns_rows:
+                yield from result_proxy
+
     def load_config(self) -> None:
         """
-        Loads the configuration from the specified file.
+        Loads the configuration from the specified file and the values of
+        the configured section. The parsed file is shared between handlers
+        until it is modified, so `self.config` must not be changed.
         """
         if not self.config:
-            self.config = configparser.ConfigParser()
-            self.config.read(self.config_file)
-            if not self.config.has_section(self.section):
+            config: configparser.ConfigParser = _load_config(
+                self.config_file, os.stat(self.config_file).st_mtime_ns
+            )
+            if not config.has_section(self.section):
                 raise configparser.NoSectionError(
                     f"No section '{self.section}' in {self.config_file}"
                 )
+            self.config = config
+            self.section_config = dict(config.items(self.section))
+
+    def _get_option(self, option: str) -> str:
+        """
+        Returns a required option of the configured section.
+
+        Args:
+            option (str): The name of the option.
+
+        Returns:
+            str: The value of the option.
+        """
+        if option not in self.section_config:
+            raise configparser.NoOptionError(option, self.section)
+        return self.section_config[option]
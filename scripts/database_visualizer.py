@@ -1,8 +1,8 @@
 import os as _os
-from typing import List, Tuple
 import click as _click
 import networkx as _nx
 import matplotlib.pyplot as _plt
+import sqlalchemy as _sa
 import dev_helper.database_handler as _db_helper
 
 
@@ -20,71 +20,53 @@ Usage:
 """
 
 
-def clean_data(
-    data: List[Tuple[str, ...]],
-) -> List[Tuple[str, str]]:
-    """
-    This function hust filters the retrieved data, and returns only the needed two fields of the output:
-    The name of the Table and the name of the Table which uses data of the previous tables as Foreignkeys.
-
-    Args:
-    - data (List[Tuple[str, ...]]): List of tuples which contains
-                                    the tables which have a relationshio (and the direction);
-                                    also the IDs and the Foreignkeys
-    returns:
-    - List[Tuple[[str, str]]]:      The data but without Primarykey and name of the Foreignkeys
-    """
-    return [(row[1], row[3]) for row in data]
-
-
-def create_graph(
-    sql_result: List,
-) -> _nx.Graph:
-    return _nx.DiGraph(sql_result)
-
-
 def get_relations_of_db(
     db_spec: str,
-) -> List:
+) -> _nx.DiGraph:
     """
-    Fetches the relationship out ouf the database
+    Fetches the relationship out ouf the database and streams the rows
+    directly into a directed graph
 
     args:
     - db_spec (str):    spec of the desired database
 
     returns:
-        result (List):  SQL-Result/Relations of the tables
+        di_graph (_nx.DiGraph): Graph with an edge from every table to each
+                                table it references
     """
-
+    di_graph = _nx.DiGraph()
     with _db_helper.DatabaseHandler(
         section=db_spec,
         use_context_manager=True,
     ) as session:
-        result = session.execute_query(create_statement())
+        di_graph.add_edges_from(
+            (row[0], row[1]) for row in session.execute_query_iter(_RELATIONS_STMT)
+        )
 
-    return result
+    return di_graph
 
 
 def create_statement():
     sql_statement = """
         SELECT
-            conname AS constraint_name,
-            conrelid::regclass AS table_or_view_name,
-            a.attname AS column_name,
-            confrelid::regclass AS referenced_table_name,
-            af.attname AS referenced_column_name
+            conrelid::regclass::text AS table_or_view_name,
+            confrelid::regclass::text AS referenced_table_name
         FROM
             pg_constraint AS c
-            JOIN pg_attribute AS a ON a.attnum = ANY(c.conkey) AND a.attrelid = c.conrelid
-            JOIN pg_attribute AS af ON af.attnum = ANY(c.confkey) AND af.attrelid = c.confrelid
         WHERE
-            conrelid::regclass::text IN (SELECT table_name FROM information_schema.tables WHERE table_schema = 'public')
+            c.contype = 'f'
+            AND conrelid::regclass::text IN (SELECT table_name FROM information_schema.tables WHERE table_schema = 'public')
+        GROUP BY
+            conrelid, confrelid
         ORDER BY
-            conrelid, conkey;
+            conrelid, confrelid;
     """
     return sql_statement
 
 
+_RELATIONS_STMT: _sa.TextClause = _sa.text(create_statement())
+
+
 def plot_graph(
     di_graph: _nx.Graph,
     layout: str,
@@ -174,12 +156,9 @@ def main(
     returns:
     - None
     """
-    result = clean_data(
-        get_relations_of_db(
-            db_spec=db_spec,
-        ),
+    di_graph = get_relations_of_db(
+        db_spec=db_spec,
     )
-    di_graph = create_graph(result)
     plot_graph(
         di_graph,
         layout,
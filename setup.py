@@ -6,7 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         'sqlalchemy==2.0.23',
-        'psycopg2==2.9.9',
+        'psycopg[binary]>=3.1,<4',
         'click==8.1.7',
         'networkx==3.2.1',
         'matplotlib==3.8.2',
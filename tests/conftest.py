@@ -0,0 +1,30 @@
+import pytest
+import dev_helper.database_handler as _db_handler
+from dev_helper.database_handler import DatabaseHandler
+
+
+@pytest.fixture(scope="session")
+def db_handler():
+    """
+    Provides one DatabaseHandler whose engine and connection pool are shared
+    by all tests of the session. `connect()` only creates the engine; the
+    first database connection is opened by the tests using it.
+    """
+    handler = DatabaseHandler(section="test_pj_helper_database")
+    handler.connect()
+    yield handler
+    DatabaseHandler.shutdown()
+
+
+@pytest.fixture
+def isolated_engine_cache(monkeypatch):
+    """
+    Replaces the shared engine and session factory caches with empty ones,
+    so a test neither touches the engine of `db_handler` nor leaves its own
+    engines behind.
+    """
+    monkeypatch.setattr(_db_handler, "_ENGINE_CACHE", {})
+    monkeypatch.setattr(_db_handler, "_SESSION_FACTORY_CACHE", {})
+    yield _db_handler._ENGINE_CACHE
+    for engine in _db_handler._ENGINE_CACHE.values():
+        engine.dispose()
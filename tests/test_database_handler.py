@@ -1,7 +1,11 @@
+import os
+import pytest
 from sqlalchemy import text as _sa_text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError
-from configparser import NoSectionError
+from sqlalchemy.pool import NullPool
+from configparser import NoOptionError, NoSectionError
+import dev_helper.database_handler as _db_handler
 from dev_helper.database_handler import DatabaseHandler
 
 
@@ -18,27 +22,24 @@ def test_find_config_file():
     )
 
 
-def test_connect():
+def test_connect(db_handler):
     """
     Test if the connect method establishes a connection and creates an engine.
     """
-    db = DatabaseHandler(section="test_pj_helper_database")
-    db.connect()
-    assert db.engine is not None
+    assert db_handler.engine is not None
 
 
-def test_create_session():
+def test_create_session(db_handler):
     """
     Test if the create_session method creates a new database session.
     """
-    db = DatabaseHandler(section="test_pj_helper_database")
-    db.connect()
-    session = db.create_session()
+    session = db_handler.create_session()
     assert isinstance(session, Session)
-    assert session.bind is db.engine
+    assert session.bind is db_handler.engine
+    session.close()
 
 
-def test_execute_create_table():
+def test_execute_create_table(db_handler):
     """
     Test if the execute_query method correctly executes a SQL query and returns the result.
     """
@@ -54,9 +55,258 @@ def test_execute_create_table():
     """)
     param = {'x': 'test_table'}
 
-    handler = DatabaseHandler(section="test_pj_helper_database")
-    with handler.get_session() as session:
+    with db_handler.get_session() as session:
         session.execute(create_table_sql)
         session.commit()
         result = session.execute(check_query, param).scalar()
         assert result is True
+
+
+def write_config(path, section="unit_test", **options):
+    """
+    Writes a configuration file with a single section to the given path.
+    """
+    options = {"host": "localhost", "port": "5432", "user": "test_user", **options}
+    lines = [f"[{section}]"] + [f"{key}={value}" for key, value in options.items()]
+    path.write_text("\n".join(lines) + "\n")
+
+
+class FakeSession:
+    """
+    Records which session methods were called.
+    """
+
+    def __init__(self):
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        self.closed = True
+
+
+def test_find_config_file_searches_parent_directories(tmp_path, monkeypatch):
+    """
+    Test if the configuration file is found in a parent of the working directory.
+    """
+    write_config(tmp_path / "unit_test.db.conf")
+    work_dir = tmp_path / "a" / "b"
+    work_dir.mkdir(parents=True)
+    monkeypatch.chdir(work_dir)
+
+    handler = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    assert handler.config_file == str((tmp_path / "unit_test.db.conf").resolve())
+
+
+def test_find_config_file_notices_moved_file(tmp_path, monkeypatch):
+    """
+    Test if the lookup finds the configuration file again after it was moved
+    closer to the working directory.
+    """
+    work_dir = tmp_path / "sub"
+    work_dir.mkdir()
+    write_config(tmp_path / "unit_test.db.conf")
+    monkeypatch.chdir(work_dir)
+    handler = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    assert handler.config_file == str((tmp_path / "unit_test.db.conf").resolve())
+
+    (tmp_path / "unit_test.db.conf").rename(work_dir / "unit_test.db.conf")
+    handler = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    assert handler.config_file == str((work_dir / "unit_test.db.conf").resolve())
+    handler.load_config()
+
+
+def test_find_config_file_deep_search(tmp_path, monkeypatch):
+    """
+    Test if the filesystem is only walked when deep_search is set.
+    """
+    monkeypatch.chdir(tmp_path)
+    deep_dir = str(tmp_path / "deep")
+    monkeypatch.setattr(
+        _db_handler.os,
+        "walk",
+        lambda root: iter([(deep_dir, [], ["unit_test_missing.db.conf"])]),
+    )
+
+    with pytest.raises(FileNotFoundError):
+        DatabaseHandler(config_file="unit_test_missing.db.conf")
+    handler = DatabaseHandler(config_file="unit_test_missing.db.conf", deep_search=True)
+    assert handler.config_file == f"{deep_dir}/unit_test_missing.db.conf"
+
+
+def test_load_config_reloads_modified_file(tmp_path, monkeypatch):
+    """
+    Test if the parsed configuration is shared until the file is modified.
+    """
+    config_path = tmp_path / "unit_test.db.conf"
+    write_config(config_path, host="first_host")
+    monkeypatch.chdir(tmp_path)
+
+    first = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    second = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    first.load_config()
+    second.load_config()
+    assert first.config is second.config
+    assert first.section_config["host"] == "first_host"
+
+    mtime_ns = config_path.stat().st_mtime_ns
+    write_config(config_path, host="second_host")
+    os.utime(config_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    third = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    third.load_config()
+    assert third.section_config["host"] == "second_host"
+    assert third.config.get("unit_test", "host") == "second_host"
+
+
+def test_connect_missing_option(tmp_path, monkeypatch):
+    """
+    Test if connect raises NoOptionError when a required option is missing.
+    """
+    (tmp_path / "unit_test.db.conf").write_text("[unit_test]\nhost=h\nport=1\n")
+    monkeypatch.chdir(tmp_path)
+
+    handler = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    with pytest.raises(NoOptionError):
+        handler.connect()
+
+
+def test_handlers_share_engine(tmp_path, monkeypatch, isolated_engine_cache):
+    """
+    Test if handlers for the same database share one cached engine.
+    """
+    write_config(tmp_path / "unit_test.db.conf")
+    monkeypatch.chdir(tmp_path)
+
+    first = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    second = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    first.connect()
+    second.connect()
+    assert first.engine is second.engine
+    assert list(isolated_engine_cache.values()) == [first.engine]
+
+
+def test_exit_disposes_private_engine(tmp_path, monkeypatch, isolated_engine_cache):
+    """
+    Test if a handler built with engine_options disposes its own engine on exit.
+    """
+    write_config(tmp_path / "unit_test.db.conf")
+    monkeypatch.chdir(tmp_path)
+
+    handler = DatabaseHandler(
+        config_file="unit_test.db.conf",
+        section="unit_test",
+        engine_options={"poolclass": NullPool},
+    )
+    with handler:
+        assert handler.engine not in isolated_engine_cache.values()
+    assert handler.engine is None
+    assert isolated_engine_cache == {}
+
+
+def test_shutdown_replaces_engine(tmp_path, monkeypatch, isolated_engine_cache):
+    """
+    Test if shutdown empties the cache and existing handlers connect and create
+    sessions on a new shared engine afterwards.
+    """
+    write_config(tmp_path / "unit_test.db.conf")
+    monkeypatch.chdir(tmp_path)
+
+    handler = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+    handler.connect()
+    old_engine = handler.engine
+    DatabaseHandler.shutdown()
+    assert isolated_engine_cache == {}
+
+    session = handler.create_session()
+    assert session.bind is not old_engine
+    assert session.bind is handler.engine
+    assert list(isolated_engine_cache.values()) == [handler.engine]
+    session.close()
+
+    DatabaseHandler.shutdown()
+    handler.connect()
+    assert handler.engine in isolated_engine_cache.values()
+
+
+def test_exit_rolls_back_only_on_exception(
+    tmp_path, monkeypatch, isolated_engine_cache
+):
+    """
+    Test if exiting the handler always closes the session and only rolls
+    back when an exception occurred.
+    """
+    write_config(tmp_path / "unit_test.db.conf")
+    monkeypatch.chdir(tmp_path)
+    handler = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+
+    session = FakeSession()
+    monkeypatch.setattr(handler, "create_session", lambda: session)
+    with handler:
+        pass
+    assert session.closed and not session.rolled_back
+
+    session = FakeSession()
+    with pytest.raises(ValueError):
+        with handler:
+            raise ValueError
+    assert session.closed and session.rolled_back
+
+
+def test_get_session_commits_on_success(tmp_path, monkeypatch, isolated_engine_cache):
+    """
+    Test if get_session commits on success, rolls back on errors and
+    always closes the session.
+    """
+    write_config(tmp_path / "unit_test.db.conf")
+    monkeypatch.chdir(tmp_path)
+    handler = DatabaseHandler(config_file="unit_test.db.conf", section="unit_test")
+
+    session = FakeSession()
+    monkeypatch.setattr(handler, "create_session", lambda: session)
+    with handler.get_session():
+        pass
+    assert session.committed and session.closed and not session.rolled_back
+
+    session = FakeSession()
+    with pytest.raises(ValueError):
+        with handler.get_session():
+            raise ValueError
+    assert session.rolled_back and session.closed and not session.committed
+
+
+def test_execute_query_text_clause(db_handler):
+    """
+    Test if execute_query accepts an already built text clause.
+    """
+    result = db_handler.execute_query(_sa_text("SELECT :x"), {"x": 1})
+    assert [tuple(row) for row in result] == [(1,)]
+
+
+def test_execute_query_iter(db_handler):
+    """
+    Test if execute_query_iter yields all rows of the query.
+    """
+    rows = db_handler.execute_query_iter("SELECT generate_series(1, 3)")
+    assert [tuple(row) for row in rows] == [(1,), (2,), (3,)]
+
+
+def test_execute_query_iter_releases_connection(db_handler):
+    """
+    Test if stopping the iteration early returns the connection to the pool.
+    """
+    for row in db_handler.execute_query_iter("SELECT generate_series(1, 1000)"):
+        assert tuple(row) == (1,)
+        break
+    assert db_handler.engine.pool.checkedout() == 0
+
+    rows = db_handler.execute_query_iter("SELECT generate_series(1, 1000)")
+    next(rows)
+    assert db_handler.engine.pool.checkedout() == 1
+    rows.close()
+    assert db_handler.engine.pool.checkedout() == 0
@@ -0,0 +1,43 @@
+import os
+import sys
+import networkx as _nx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts"))
+import database_visualizer  # noqa: E402
+
+
+def test_get_relations_of_db(db_handler):
+    """
+    Test if get_relations_of_db returns one edge per pair of related tables,
+    also for multi-column and self-referencing foreign keys.
+    """
+    db_handler.execute_query("DROP TABLE IF EXISTS viz_child, viz_parent;")
+    db_handler.execute_query("""
+    CREATE TABLE viz_parent (
+    a INTEGER,
+    b INTEGER,
+    PRIMARY KEY (a, b)
+    );
+    CREATE TABLE viz_child (
+    id SERIAL PRIMARY KEY,
+    parent_a INTEGER,
+    parent_b INTEGER,
+    previous_id INTEGER REFERENCES viz_child (id),
+    FOREIGN KEY (parent_a, parent_b) REFERENCES viz_parent (a, b)
+    );
+    """)
+    try:
+        rows = db_handler.execute_query(database_visualizer._RELATIONS_STMT)
+        di_graph = database_visualizer.get_relations_of_db(
+            db_spec="test_pj_helper_database"
+        )
+    finally:
+        db_handler.execute_query("DROP TABLE viz_child, viz_parent;")
+
+    expected = [("viz_child", "viz_child"), ("viz_child", "viz_parent")]
+    assert sorted(tuple(row) for row in rows if row[0].startswith("viz_")) == expected
+    assert isinstance(di_graph, _nx.DiGraph)
+    assert sorted(edge for edge in di_graph.edges if edge[0].startswith("viz_")) == (
+        expected
+    )
+    assert all(isinstance(node, str) for node in di_graph.nodes)